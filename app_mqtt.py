@@ -1,13 +1,17 @@
 import json
 import logging
 import os
+import socket
 import sys
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as wait_futures
+from typing import Any, Dict, Optional, Tuple
 
 from commands.arm_actions.actions import ArmActions
+from commands.arm_io import ArmIOWorker, read_all_angles, read_angle
 from commands.face_tracking.controller import FaceTrackingController
 
 try:
@@ -22,9 +26,74 @@ except Exception as e:  # pragma: no cover
         "paho-mqtt is required. Install with: pip install paho-mqtt"
     ) from e
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+
+# 초 단위 접두사 캐시: (epoch 초, "YYYY-MM-DDTHH:MM:SS")
+_iso_sec_cache: Tuple[int, str] = (-1, "")
+
 
 def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # datetime 객체 생성 없이 time.time() 기반으로 포맷 (같은 초 안에서는 접두사 재사용)
+    global _iso_sec_cache
+    t = time.time()
+    sec = int(t)
+    cached_sec, prefix = _iso_sec_cache
+    if cached_sec != sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_sec_cache = (sec, prefix)
+    return f"{prefix}.{int((t - sec) * 1_000_000):06d}Z"
+
+
+# 명령 문자열(동의어 포함) -> 핸들러 메서드 이름. 동의어 판별이 해시 한 번으로 끝남
+_CMD_HANDLERS = {
+    "face_tracking": "_cmd_start_face_tracking",
+    "face_tracking_mode": "_cmd_start_face_tracking",
+    "face_tracking_모드": "_cmd_start_face_tracking",
+    "stop_face_tracking": "_cmd_stop_face_tracking",
+    "stop_face_tracking_mode": "_cmd_stop_face_tracking",
+    "make_heart": "_cmd_make_heart",
+    "hug": "_cmd_hug",
+    "make_hug": "_cmd_hug",
+    "init_pose": "_cmd_init_pose",
+    "init": "_cmd_init_pose",
+    "ready_pose": "_cmd_init_pose",
+    "set_joint": "_cmd_set_joint",
+    "set_joints": "_cmd_set_joints",
+    "nudge_joint": "_cmd_nudge_joint",
+}
+
+# 전송 대기 중인 이전 프레임을 이 시간(초)보다 오래 기다리지는 않음
+# (연결이 끊기며 큐에서 사라진 메시지가 게시를 영구히 막지 않도록)
+_PENDING_PUBLISH_MAX_AGE_S = 2.0
+
+
+def _validate_sid(sid: Any) -> Optional[int]:
+    # 프론트엔드는 보통 int를 보내므로 int()/예외 처리 없이 바로 범위만 확인
+    if type(sid) is int:
+        return sid if 1 <= sid <= 6 else None
+    try:
+        sid_i = int(sid)
+    except (TypeError, ValueError, OverflowError):
+        # OverflowError: 표준 json 폴백은 1e999를 inf로 파싱하고 int(inf)가 실패함
+        return None
+    return sid_i if 1 <= sid_i <= 6 else None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    # orjson이 있으면 C 구현으로 바로 bytes 생성 (paho는 bytes를 그대로 전송)
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class CarebotAppMQTT:
@@ -50,6 +119,10 @@ class CarebotAppMQTT:
 
         # 다중 로봇 구분용 ID: CLI 인자 우선, 미제공 시 기본값 'robot_left'
         self.robot_id = robot_id_override or "robot_left"
+        # 수신 메시지의 robot_id 허용 값 (미지정/브로드캐스트 포함)
+        self._accepted_robot_ids = (None, "", self.robot_id, "all")
+        # 송신 메시지마다 주입하는 식별 메타 (한 번만 생성해 재사용)
+        self._envelope = {"who": "carebot", "robot_id": self.robot_id}
 
         # Arm 시리얼 포트(by-path 권장): which_arm/robot_id에 맞춰 좌/우 우선, 없으면 공통 포트 사용
         # 예: /dev/serial/by-path/pci-0000:03:00.0-usb-0:1.2:1.0-port0
@@ -77,11 +150,31 @@ class CarebotAppMQTT:
                 cfg.get("camera_index_right", cfg.get("camera_index", 0))
             )
         update_interval_ms = int(cfg.get("update_interval_ms", 200))
+        # 얼굴 검출 크기 범위(640x480 기준 px)
+        face_min_px = int(cfg.get("face_min_px", 48))
+        face_max_px = int(cfg.get("face_max_px", 240))
+        detect_interval_ms = int(cfg.get("face_detect_interval_ms", 150))
+        motion_min_px = int(cfg.get("face_motion_min_px", 200))
+        # 연속 서보 읽기 사이의 버스 안정화 지연(초). 0이면 지연 없이 연속 읽기
+        self._read_settle_s = max(
+            0.0, float(cfg.get("arm_read_settle_ms", 0.5)) / 1000.0
+        )
+        # 텔레메트리 묶음 전송: N개 샘플 또는 T ms마다 joint_state_batch 한 번 (1이면 기존 단건 전송)
+        self._telemetry_batch_size = max(1, int(cfg.get("telemetry_batch_size", 1)))
+        self._telemetry_batch_s = (
+            max(0, int(cfg.get("telemetry_batch_ms", 500))) / 1000.0
+        )
 
         # 로봇팔 및 컨트롤러 초기화
         self.arm = None
-        self._arm_io_lock = threading.Lock()
+        self._arm_io: Optional[ArmIOWorker] = None
+        self._telemetry_read: Optional[Future] = None
+        # 마지막 수동 조작 시각 (경과 시간 비교 전용이므로 time.monotonic 기준)
         self._last_manual_ts = 0.0
+        # 오류 응답의 고정 부분(직렬화된 접두사) 캐시: (type, error) -> bytes
+        self._error_prefixes: Dict[Tuple[str, str], bytes] = {}
+        # 대체 가능한 프레임 종류별 마지막 발행 정보: type -> (MQTTMessageInfo, monotonic)
+        self._pending_publish: Dict[str, Tuple[Any, float]] = {}
         try:
             if Arm_Lib is not None:
                 if self.arm_port:
@@ -97,12 +190,15 @@ class CarebotAppMQTT:
                     self.arm = Arm_Lib.Arm_Device()
         except Exception:
             self.arm = None
+        if self.arm is not None:
+            # 모든 Arm_Lib I/O는 전용 워커 스레드가 순서대로 수행 (공유 락 불필요)
+            self._arm_io = ArmIOWorker(self.arm)
+            self.arm = self._arm_io.device
 
         try:
             self.actions = (
                 ArmActions(
                     arm_device=self.arm,
-                    arm_lock=self._arm_io_lock,
                     robot_id=self.robot_id,
                     config=self._config,
                 )
@@ -116,8 +212,17 @@ class CarebotAppMQTT:
 
         self._cmd_lock = threading.Lock()
         self._current_cmd = None
-        self._action_thread = None
         self._action_cancel = None
+        # 동작은 단일 워커 풀에서 순서대로 실행 (스레드 재사용, Future로 상태/취소 관리)
+        self._action_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="Action"
+        )
+        self._action_future: Optional[Future] = None
+        # 명령 처리(선점 + 핸들러)는 별도 단일 워커에서 순서대로 실행해
+        # paho 네트워크 스레드가 서보 I/O나 선점 대기에 묶이지 않게 함
+        self._cmd_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="MqttCmd"
+        )
 
         self.face_tracking: Optional[FaceTrackingController] = None
         if self.arm is not None:
@@ -125,12 +230,26 @@ class CarebotAppMQTT:
                 arm_device=self.arm,
                 camera_index=camera_index,
                 update_interval_ms=update_interval_ms,
+                face_min_px=face_min_px,
+                face_max_px=face_max_px,
+                detect_interval_ms=detect_interval_ms,
+                motion_min_px=motion_min_px,
             )
             self.face_tracking.set_callback(self._on_face_tracking_event)
-            try:
-                self.face_tracking.set_arm_io_lock(self._arm_io_lock)
-            except Exception:
-                pass
+
+        # 기능 목록은 초기화 이후 변하지 않으므로 한 번만 계산 (재연결 시 재사용)
+        capabilities = []
+        if self.face_tracking is not None:
+            capabilities.append("face_tracking")
+        if self.actions is not None:
+            capabilities += ["make_heart", "hug", "init_pose", "manual_control"]
+        # hello 메시지 본문도 고정: 연결 시 ts만 붙여 전송
+        self._hello_payload = {
+            "type": "hello",
+            "agent": "carebot",
+            "robot_id": self.robot_id,
+            "capabilities": capabilities,
+        }
 
         self.log.info(
             "initialized | mqtt=%s:%s base=%s, cam=%s, interval_ms=%s, arm=%s, port=%s",
@@ -142,8 +261,11 @@ class CarebotAppMQTT:
             "yes" if self.arm is not None else "no",
             self.arm_port or "default",
         )
-        if self.arm is not None:
-            self._start_joint_stream(interval_ms=update_interval_ms)
+
+        # 명령 디스패치 테이블: 바운드 메서드를 인스턴스당 한 번만 해석
+        self._dispatch = {
+            cmd: getattr(self, name) for cmd, name in _CMD_HANDLERS.items()
+        }
 
         # MQTT 클라이언트 (paho-mqtt 2.x 권장 콜백 API 사용, 하위호환 처리)
         # 인스턴스마다 고유 client_id 사용 (동일 ID 중복 접속 시 기존 연결이 끊김)
@@ -165,6 +287,15 @@ class CarebotAppMQTT:
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
         self.client.on_disconnect = self._on_disconnect
+        # 재접속은 paho 네트워크 루프에 맡김 (1s부터 최대 30s까지 지수 백오프)
+        self.client.reconnect_delay_set(min_delay=1, max_delay=30)
+        # 느린 링크에서 발행 큐가 끝없이 쌓이지 않도록 상한 설정
+        self.client.max_inflight_messages_set(20)
+        self.client.max_queued_messages_set(1000)
+
+        # 텔레메트리 스레드는 클라이언트 준비 후 시작 (접속 상태 확인/발행에 사용)
+        if self.arm is not None:
+            self._start_joint_stream(interval_ms=update_interval_ms)
 
     # -------------- MQTT 콜백 --------------
     def _on_connect(
@@ -176,22 +307,22 @@ class CarebotAppMQTT:
         properties: Optional[Any] = None,
     ):
         self.log.info("mqtt connected rc=%s", rc)
+        self._tune_socket(client)
         client.subscribe(self.topic_carebot_rx, qos=self.mqtt_qos)
         # hello + capabilities 전송
-        capabilities = []
-        if self.face_tracking is not None:
-            capabilities.append("face_tracking")
-        if self.actions is not None:
-            capabilities += ["make_heart", "hug", "init_pose", "manual_control"]
-        self._send(
-            {
-                "type": "hello",
-                "ts": now_iso(),
-                "agent": "carebot",
-                "robot_id": self.robot_id,
-                "capabilities": capabilities,
-            }
-        )
+        self._send({**self._hello_payload, "ts": now_iso()})
+
+    def _tune_socket(self, client: mqtt.Client):
+        # 작은 ack/result 프레임이 Nagle 지연(최대 ~40ms) 없이 바로 나가도록 설정
+        sock = client.socket()
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, "TCP_QUICKACK"):  # Linux 전용
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except Exception:
+            self.log.debug("tcp socket tuning skipped", exc_info=True)
 
     def _on_disconnect(
         self,
@@ -203,23 +334,21 @@ class CarebotAppMQTT:
         **kwargs: Any,
     ):
         # paho-mqtt v1/v2 모두 호환: 추가 인수 무시, rc가 ReasonCode일 수도 있음
-        try:
-            rc_repr = getattr(rc, "value", rc)
-        except Exception:
-            rc_repr = rc
+        rc_repr = getattr(rc, "value", rc)
         self.log.info("mqtt disconnected rc=%s", rc_repr)
 
     def _on_message(self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage):
         try:
-            data = json.loads(msg.payload.decode("utf-8"))
+            # payload(bytes)를 문자열로 디코딩하지 않고 그대로 파싱
+            data = _json_loads(msg.payload)
         except Exception:
-            self._send({"type": "error", "ts": now_iso(), "error": "invalid_json"})
+            self._send_error("invalid_json", kind="error")
             return
         self.log.info("mqtt recv on %s: %s", msg.topic, data)
 
         # 다중 로봇: robot_id가 지정되어 있고, 내 로봇이 아니면 무시 (broadcast: 'all' 허용)
         rid = data.get("robot_id")
-        if rid not in (None, "", self.robot_id, "all"):
+        if rid not in self._accepted_robot_ids:
             return
 
         # 명령만 수락 (WS 로직과 동일)
@@ -233,7 +362,7 @@ class CarebotAppMQTT:
 
         cmd = (data.get("command") or "").strip()
         if not cmd:
-            self._send({"type": "error", "ts": now_iso(), "error": "missing_command"})
+            self._send_error("missing_command", kind="error")
             return
 
         # ack 전송
@@ -241,84 +370,77 @@ class CarebotAppMQTT:
             {"type": "ack", "ts": now_iso(), "command": cmd, "status": "accepted"}
         )
 
+        # 진행 중인 동작에는 취소 신호를 바로 보내고, 나머지 처리는 명령 워커에 맡김
+        cancel_event = self._action_cancel
+        if cancel_event is not None:
+            cancel_event.set()
+        self._cmd_executor.submit(self._dispatch_command, cmd, data)
+
+    def _dispatch_command(self, cmd: str, data: Dict[str, Any]):
         # 선점(기존 동작 중단)
         self.log.info("preempt then dispatch | command=%s", cmd)
-        self._preempt_current()
-
-        start_tracking_cmds = {
-            "face_tracking",
-            "face_tracking_mode",
-            "face_tracking_모드",
-        }
-        stop_tracking_cmds = {"stop_face_tracking", "stop_face_tracking_mode"}
-
-        if cmd in start_tracking_cmds:
-            self._cmd_start_face_tracking(cmd)
-            return
-        if cmd in stop_tracking_cmds:
-            self._cmd_stop_face_tracking(cmd)
-            return
-        if cmd == "make_heart":
-            self._cmd_make_heart(cmd)
-            return
-        if cmd in {"hug", "make_hug"}:
-            self._cmd_hug(cmd)
-            return
-        if cmd in {"init_pose", "init", "ready_pose"}:
-            self._cmd_init_pose(cmd)
-            return
-        if cmd == "set_joint":
-            self._cmd_set_joint(cmd, data)
-            return
-        if cmd == "set_joints":
-            self._cmd_set_joints(cmd, data)
-            return
-        if cmd == "nudge_joint":
-            self._cmd_nudge_joint(cmd, data)
-            return
-        self._send(
-            {
-                "type": "error",
-                "ts": now_iso(),
-                "error": "unknown_command",
-                "command": cmd,
-            }
-        )
+        try:
+            self._preempt_current()
+            handler = self._dispatch.get(cmd)
+            if handler is not None:
+                handler(cmd, data)
+                return
+            self._send_error("unknown_command", cmd, kind="error")
+        except Exception:
+            self.log.exception("command handler failed | command=%s", cmd)
 
     # -------------- 명령 헬퍼 (WS 앱과 동일) --------------
     def _preempt_current(self):
+        try:
+            if self.face_tracking is not None and self.face_tracking.is_running():
+                self.log.info("stopping face_tracking for preemption")
+                self.face_tracking.stop()
+        except Exception:
+            pass
+        # 상태는 락 안에서 꺼내 비우고, cancel()/대기는 락 밖에서 수행.
+        # 시작 전 Future의 cancel()은 완료 콜백(_clear_action)을 이 스레드에서
+        # 즉시 실행하는데, 그 콜백이 _cmd_lock을 다시 잡으므로 락 안에서는 교착됨
         with self._cmd_lock:
-            try:
-                if self.face_tracking is not None and self.face_tracking.is_running():
-                    self.log.info("stopping face_tracking for preemption")
-                    self.face_tracking.stop()
-            except Exception:
-                pass
-            try:
-                if self._action_thread is not None and self._action_thread.is_alive():
-                    if self._action_cancel is None:
-                        self._action_cancel = threading.Event()
-                    self.log.info("cancelling running action thread")
-                    self._action_cancel.set()
-                    self._action_thread.join(timeout=2.0)
-            except Exception:
-                pass
-            self._action_thread = None
+            fut = self._action_future
+            cancel_event = self._action_cancel
+            cmd_name = self._current_cmd
+            self._action_future = None
             self._action_cancel = None
             self._current_cmd = None
+        try:
+            if fut is not None and not fut.done():
+                self.log.info("cancelling running action")
+                if cancel_event is not None:
+                    cancel_event.set()
+                if fut.cancel():
+                    # 아직 시작 전이던 작업: 러너가 돌지 않으므로 결과를 여기서 보고
+                    self._send(
+                        {
+                            "type": "result",
+                            "ts": now_iso(),
+                            "command": cmd_name,
+                            "status": "cancelled",
+                            "outcome": None,
+                        }
+                    )
+                else:
+                    # 동작의 모든 대기는 cancel_event에 묶여 있어 보통 수십 ms 안에 끝남.
+                    # 250ms를 넘기면 기다리지 않고 진행: 이어서 제출되는 동작은 단일 워커
+                    # 풀에서 '시작 전' 상태로 대기하다가 이전 동작이 끝난 뒤 실행됨
+                    # (그 사이 들어온 명령은 이 대기 중 Future를 위의 cancel()로 취소하며,
+                    # cancel()을 락 밖에서 호출하므로 완료 콜백과 교착되지 않음)
+                    done, _ = wait_futures([fut], timeout=0.25)
+                    if not done:
+                        self.log.warning(
+                            "action did not stop within 250ms | %s", cmd_name
+                        )
+        except Exception:
+            pass
 
-    def _cmd_start_face_tracking(self, cmd: str):
+    def _cmd_start_face_tracking(self, cmd: str, data: Dict[str, Any]):
         if self.face_tracking is None:
             self.log.warning("face_tracking unavailable")
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "arm_or_tracker_unavailable",
-                }
-            )
+            self._send_error("arm_or_tracker_unavailable", cmd)
             return
         self.log.info("starting face_tracking")
         started = self.face_tracking.start()
@@ -335,18 +457,10 @@ class CarebotAppMQTT:
             }
         )
 
-    def _cmd_stop_face_tracking(self, cmd: str):
+    def _cmd_stop_face_tracking(self, cmd: str, data: Dict[str, Any]):
         if self.face_tracking is None:
             self.log.warning("stop face_tracking but tracker unavailable")
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "tracker_unavailable",
-                }
-            )
+            self._send_error("tracker_unavailable", cmd)
             return
         self.log.info("stopping face_tracking")
         stopped = self.face_tracking.stop()
@@ -359,47 +473,23 @@ class CarebotAppMQTT:
             }
         )
 
-    def _cmd_make_heart(self, cmd: str):
+    def _cmd_make_heart(self, cmd: str, data: Dict[str, Any]):
         if self.actions is None:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "arm_unavailable",
-                }
-            )
+            self._send_error("arm_unavailable", cmd)
             return
         self._start_action(
             cmd, lambda cancel: self.actions.make_heart(cancel_event=cancel)
         )
 
-    def _cmd_hug(self, cmd: str):
+    def _cmd_hug(self, cmd: str, data: Dict[str, Any]):
         if self.actions is None:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "arm_unavailable",
-                }
-            )
+            self._send_error("arm_unavailable", cmd)
             return
         self._start_action(cmd, lambda cancel: self.actions.hug(cancel_event=cancel))
 
-    def _cmd_init_pose(self, cmd: str):
+    def _cmd_init_pose(self, cmd: str, data: Dict[str, Any]):
         if self.actions is None:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "arm_unavailable",
-                }
-            )
+            self._send_error("arm_unavailable", cmd)
             return
         self._start_action(
             cmd, lambda cancel: self.actions.init_pose(cancel_event=cancel)
@@ -407,145 +497,61 @@ class CarebotAppMQTT:
 
     def _cmd_set_joint(self, cmd: str, data: Dict[str, Any]):
         if self.actions is None:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "arm_unavailable",
-                }
-            )
+            self._send_error("arm_unavailable", cmd)
             return
         sid = data.get("id") or data.get("sid")
         angle = data.get("angle")
         t = data.get("time_ms", 500)
-        try:
-            sid_i = int(sid)
-            if not 1 <= sid_i <= 6:
-                raise ValueError("sid_out_of_range")
-        except Exception:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "invalid_sid",
-                }
-            )
+        sid_i = _validate_sid(sid)
+        if sid_i is None:
+            self._send_error("invalid_sid", cmd)
             return
         if angle is None:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "missing_angle",
-                }
-            )
+            self._send_error("missing_angle", cmd)
             return
-        try:
-            self._last_manual_ts = time.time()
-        except Exception:
-            pass
-        self.log.info("set_joint request | sid=%s angle=%s t=%s", sid, angle, t)
-        outcome = self.actions.set_joint(sid, angle, t)
-        self._send(
-            {
-                "type": "result",
-                "ts": now_iso(),
-                "command": cmd,
-                "status": ("ok" if outcome == "ok" else "error"),
-                "outcome": outcome,
-            }
-        )
-        self.log.info("set_joint outcome | %s", outcome)
+        self._last_manual_ts = time.monotonic()
+        self.log.debug("set_joint request | sid=%s angle=%s t=%s", sid, angle, t)
+        outcome = self.actions.set_joint(sid_i, angle, t)
+        self._send_manual_result(cmd, outcome)
+        self.log.debug("set_joint outcome | %s", outcome)
 
     def _cmd_set_joints(self, cmd: str, data: Dict[str, Any]):
         if self.actions is None:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "arm_unavailable",
-                }
-            )
+            self._send_error("arm_unavailable", cmd)
             return
         angles = data.get("angles")
         t = data.get("time_ms", 500)
-        try:
-            self._last_manual_ts = time.time()
-        except Exception:
-            pass
+        self._last_manual_ts = time.monotonic()
         outcome = self.actions.set_joints(angles, t)
-        self._send(
-            {
-                "type": "result",
-                "ts": now_iso(),
-                "command": cmd,
-                "status": ("ok" if outcome == "ok" else "error"),
-                "outcome": outcome,
-            }
-        )
+        self._send_manual_result(cmd, outcome)
 
     def _cmd_nudge_joint(self, cmd: str, data: Dict[str, Any]):
         if self.actions is None:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "arm_unavailable",
-                }
-            )
+            self._send_error("arm_unavailable", cmd)
             return
         sid = data.get("id") or data.get("sid")
         delta = data.get("delta", 0)
         t = data.get("time_ms", 300)
-        try:
-            sid_i = int(sid)
-            if not 1 <= sid_i <= 6:
-                raise ValueError("sid_out_of_range")
-        except Exception:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "invalid_sid",
-                }
-            )
+        sid_i = _validate_sid(sid)
+        if sid_i is None:
+            self._send_error("invalid_sid", cmd)
             return
         try:
             int(delta)
         except Exception:
-            self._send(
-                {
-                    "type": "result",
-                    "ts": now_iso(),
-                    "command": cmd,
-                    "status": "error",
-                    "error": "invalid_delta",
-                }
-            )
+            self._send_error("invalid_delta", cmd)
             return
-        try:
-            self._last_manual_ts = time.time()
-        except Exception:
-            pass
-        outcome = self.actions.nudge_joint(sid, delta, t)
+        self._last_manual_ts = time.monotonic()
+        outcome = self.actions.nudge_joint(sid_i, delta, t)
+        self._send_manual_result(cmd, outcome)
+
+    def _send_manual_result(self, cmd: str, outcome: str):
         self._send(
             {
                 "type": "result",
                 "ts": now_iso(),
                 "command": cmd,
-                "status": ("ok" if outcome == "ok" else "error"),
+                "status": "ok" if outcome == "ok" else "error",
                 "outcome": outcome,
             }
         )
@@ -555,41 +561,6 @@ class CarebotAppMQTT:
             cancel_event = threading.Event()
             self._action_cancel = cancel_event
             self._current_cmd = cmd_name
-
-            def _runner():
-                try:
-                    self.log.info("action start | %s", cmd_name)
-                    outcome = action_callable(cancel_event)
-                    status = "completed" if not cancel_event.is_set() else "cancelled"
-                    self._send(
-                        {
-                            "type": "result",
-                            "ts": now_iso(),
-                            "command": cmd_name,
-                            "status": status,
-                            "outcome": outcome,
-                        }
-                    )
-                    self.log.info(
-                        "action result | %s | %s (%s)", cmd_name, status, outcome
-                    )
-                except Exception as e:
-                    self.log.exception("action error | %s | %s", cmd_name, e)
-                    self._send(
-                        {
-                            "type": "result",
-                            "ts": now_iso(),
-                            "command": cmd_name,
-                            "status": "error",
-                            "error": str(e),
-                        }
-                    )
-                finally:
-                    with self._cmd_lock:
-                        self._action_thread = None
-                        self._action_cancel = None
-                        self._current_cmd = None
-
             self._send(
                 {
                     "type": "progress",
@@ -598,114 +569,268 @@ class CarebotAppMQTT:
                     "status": "started",
                 }
             )
-            t = threading.Thread(target=_runner, name=f"Action-{cmd_name}", daemon=True)
-            self._action_thread = t
-            t.start()
+            fut = self._action_pool.submit(
+                self._run_action, cmd_name, action_callable, cancel_event
+            )
+            self._action_future = fut
+        # 락을 놓은 뒤 등록: 이미 끝난 Future면 콜백이 이 스레드에서 즉시 실행되어
+        # _clear_action이 _cmd_lock을 다시 잡으므로, 락 안에서 등록하면 교착됨
+        fut.add_done_callback(lambda _f: self._clear_action(cancel_event))
+
+    def _clear_action(self, cancel_event: threading.Event):
+        with self._cmd_lock:
+            if self._action_cancel is cancel_event:
+                self._action_future = None
+                self._action_cancel = None
+                self._current_cmd = None
+
+    def _action_running(self) -> bool:
+        fut = self._action_future
+        return fut is not None and not fut.done()
+
+    def _run_action(self, cmd_name: str, action_callable, cancel_event):
+        try:
+            self.log.info("action start | %s", cmd_name)
+            outcome = action_callable(cancel_event)
+            status = "completed" if not cancel_event.is_set() else "cancelled"
+            self._send(
+                {
+                    "type": "result",
+                    "ts": now_iso(),
+                    "command": cmd_name,
+                    "status": status,
+                    "outcome": outcome,
+                }
+            )
+            self.log.info("action result | %s | %s (%s)", cmd_name, status, outcome)
+        except Exception as e:
+            self.log.exception("action error | %s | %s", cmd_name, e)
+            self._send(
+                {
+                    "type": "result",
+                    "ts": now_iso(),
+                    "command": cmd_name,
+                    "status": "error",
+                    "error": str(e),
+                }
+            )
 
     # LED 제어 함수 제거됨
 
     def _on_face_tracking_event(self, event: dict):
-        event = dict(event)
+        # 컨트롤러가 매번 새 dict를 만들어 넘기므로 복사 없이 그대로 사용
         event.setdefault("ts", now_iso())
-        self._send(event)
+        # 주기적 추적 상태는 다음 이벤트가 대체하므로 밀려 있으면 버림 (오류 이벤트는 항상 전송)
+        self._send(event, droppable=event.get("status") == "running")
+
+    def _send_error(self, error: str, cmd: Optional[str] = None, kind: str = "result"):
+        """Publish a fixed-code error frame from a pre-serialized prefix.
+
+        kind "result" answers a command (status "error"); kind "error" is a
+        protocol-level error. Only ts and command are spliced in per call.
+        """
+        prefix = self._error_prefixes.get((kind, error))
+        if prefix is None:
+            head: Dict[str, Any] = {"type": kind}
+            if kind == "result":
+                head["status"] = "error"
+            head["error"] = error
+            head.update(self._envelope)
+            prefix = _json_dumps(head)[:-1] + b',"ts":"'
+            self._error_prefixes[(kind, error)] = prefix
+        if cmd is None:
+            frame = prefix + now_iso().encode("ascii") + b'"}'
+        else:
+            frame = (
+                prefix
+                + now_iso().encode("ascii")
+                + b'","command":'
+                + _json_dumps(cmd)
+                + b"}"
+            )
+        self._publish(kind, frame)
+
+    def _send(
+        self,
+        obj: Dict[str, Any],
+        droppable: bool = False,
+        *,
+        qos: Optional[int] = None,
+    ) -> bool:
+        """Publish obj on the carebot tx topic; return False if it was not sent.
+
+        droppable marks frames superseded by the next one of the same type
+        (joint_state, running face_tracking). Such a frame is dropped while
+        the previous one is still queued in the client instead of piling up
+        stale state behind a slow link.
+
+        obj is modified in place (who/robot_id are set on it), so callers
+        must pass a dict they own; every call site builds a fresh literal.
+        qos defaults to the configured mqtt_qos; telemetry overrides it.
+        """
+        # 전송 메타: 항상 robot_id를 강제 주입하여 프런트/백엔드가 로봇을 식별 가능하게 함
+        obj.update(self._envelope)
+        try:
+            data = _json_dumps(obj)
+        except Exception:
+            return False
+        return self._publish(obj.get("type"), data, droppable, qos)
 
-    def _send(self, obj: Dict[str, Any]):
+    def _publish(
+        self,
+        kind: Optional[str],
+        data: bytes,
+        droppable: bool = False,
+        qos: Optional[int] = None,
+    ) -> bool:
+        """Publish an already-serialized frame of the given type (see _send)."""
         try:
-            payload = dict(obj)
-            # 전송 메타: 항상 robot_id를 강제 주입하여 프런트/백엔드가 로봇을 식별 가능하게 함
-            payload["who"] = payload.get("who") or "carebot"
-            payload["robot_id"] = self.robot_id
-            self.client.publish(
-                self.topic_carebot_tx, json.dumps(payload), qos=self.mqtt_qos
+            if droppable:
+                prev = self._pending_publish.get(kind)
+                if prev is not None:
+                    info, sent_at = prev
+                    if (
+                        not info.is_published()
+                        and (time.monotonic() - sent_at) < _PENDING_PUBLISH_MAX_AGE_S
+                    ):
+                        return False
+            info = self.client.publish(
+                self.topic_carebot_tx,
+                data,
+                qos=self.mqtt_qos if qos is None else qos,
             )
+            if droppable and getattr(info, "rc", 0) == 0:
+                self._pending_publish[kind] = (info, time.monotonic())
+            return True
         except Exception:
-            pass
+            return False
+
+    def _read_angles(self, force: bool = False) -> Optional[list]:
+        # 6축 읽기를 I/O 워커에 한 번에 요청. 이전 요청이 아직
+        # 대기 중이면 새로 쌓지 않고 그 결과를 기다림
+        pending = self._telemetry_read
+        if pending is None:
+            pending = self._arm_io.submit(read_all_angles, self._read_settle_s)
+            self._telemetry_read = pending
+        try:
+            res = pending.result(timeout=0.2 if force else 0.1)
+        except FutureTimeoutError:
+            return None
+        except Exception:
+            res = None
+        self._telemetry_read = None
+        return res
+
+    def _is_idle(self, manual_active: bool) -> bool:
+        if manual_active or self._action_running():
+            return False
+        return self.face_tracking is None or not self.face_tracking.is_running()
+
+    def _base_unchanged(self, last_base: Optional[int]) -> bool:
+        if last_base is None or self._telemetry_read is not None:
+            return False
+        try:
+            return self._arm_io.call(read_angle, 1, timeout=0.1) == last_base
+        except Exception:
+            return False
 
     def _start_joint_stream(self, interval_ms: int = 200):
         if getattr(self, "_telemetry_thread", None):
             return
         self._telemetry_stop = threading.Event()
-        self._telemetry_seq = 0
 
         def _loop():
+            # 루프에서 매 틱 쓰는 속성/함수는 지역 변수로 한 번만 바인딩
+            stop_wait = self._telemetry_stop.wait
+            monotonic = time.monotonic
+            send = self._send
+            read_angles = self._read_angles
+            is_idle = self._is_idle
+            base_unchanged = self._base_unchanged
+            publish = self._publish
+            # joint_state의 고정 부분(type/who/robot_id)은 미리 직렬화해 두고
+            # 매 틱에는 각도 배열과 seq/ts만 이어 붙임
+            js_prefix = (
+                _json_dumps({"type": "joint_state", **self._envelope})[:-1]
+                + b',"angles":'
+            )
+            is_connected = self.client.is_connected
+            # 활동/유휴에 따라 샘플링 주기 가변 (주기 값은 루프 동안 불변)
+            active_sleep = max(0.08, interval_ms / 1000.0)
+            idle_sleep = max(0.3, (interval_ms * 2) / 1000.0)
+            batch_size = self._telemetry_batch_size
+            batch_s = self._telemetry_batch_s
             last = [None] * 6
             first_sent = False
             force_interval_s = 1.0
             last_force = 0.0
-            min_delta = 1.0  # 도메인 노이즈 억제를 위한 최소 변화 각도(도)
-            while not self._telemetry_stop.is_set():
-                # 활동/유휴에 따라 샘플링 주기 가변
-                now_t = time.time()
-                is_active = (now_t - getattr(self, "_last_manual_ts", 0.0)) < 3.0
-                sleep_sec = (
-                    (interval_ms / 1000.0)
-                    if is_active
-                    else max(0.3, (interval_ms * 2) / 1000.0)
-                )
-                if self.arm is not None:
-
-                    def _read_angles(force: bool = False) -> Optional[list]:
-                        try:
-                            res = []
-                            acquired = False
-                            if force:
-                                acquired = self._arm_io_lock.acquire(timeout=0.2)
-                            else:
-                                acquired = self._arm_io_lock.acquire(blocking=False)
-                            if not acquired:
-                                return None
-                            try:
-                                for i in range(6):
-                                    val = self.arm.Arm_serial_servo_read(i + 1)
-                                    res.append(int(val) if val is not None else None)
-                                    time.sleep(0.003)
-                            finally:
-                                try:
-                                    self._arm_io_lock.release()
-                                except Exception:
-                                    pass
-                            return res
-                        except Exception:
-                            return None
-
-                    # 평시엔 non-blocking, 주기적으로 강제 스냅샷(blocking)
-                    force = (now_t - last_force) >= force_interval_s
-                    angles = _read_angles(force=force)
-                    if angles is not None:
-                        should_send = False
-                        if not first_sent:
-                            should_send = True
-                        else:
-                            # min_delta 기준 변화 체크
-                            for i in range(6):
-                                a_new = angles[i]
-                                a_old = last[i]
-                                if a_new is None or a_old is None:
-                                    if a_new != a_old:
-                                        should_send = True
-                                        break
-                                else:
-                                    if abs(a_new - a_old) >= min_delta:
-                                        should_send = True
-                                        break
-                            # 강제 스냅샷 타이밍에는 한번 보내기
-                            if not should_send and force:
-                                should_send = True
-                        if should_send:
-                            payload = {
-                                "type": "joint_state",
-                                "angles": angles,
-                                "ts": now_iso(),
-                                "robot_id": self.robot_id,
-                                "seq": self._telemetry_seq,
-                            }
-                            # 텔레메트리는 retain=True 권장 (백엔드에서 retain 전달 필요)
-                            self._send(payload)
-                            self._telemetry_seq += 1
-                            last = list(angles)
-                            last_force = now_t
-                            first_sent = True
-                time.sleep(max(0.08, sleep_sec))
+            seq = 0
+            batch: list = []
+            batch_t0 = 0.0
+
+            while True:
+                if not is_connected():
+                    # 브로커 미접속: 받을 곳이 없으므로 서보 읽기/발행 자체를 쉬고
+                    # (paho 큐에 오래된 프레임이 쌓이지 않게) 느린 주기로 재확인
+                    if stop_wait(2.0):
+                        break
+                    continue
+                now_t = monotonic()
+                is_active = (now_t - self._last_manual_ts) < 3.0
+                # 평시엔 non-blocking, 주기적으로 강제 스냅샷(blocking)
+                force = (now_t - last_force) >= force_interval_s
+                if first_sent and not force and is_idle(is_active):
+                    # 유휴 상태: S1만 읽어 보고 변화가 없으면 6축 읽기 자체를 생략
+                    angles = None if base_unchanged(last[0]) else read_angles()
+                else:
+                    angles = read_angles(force=force)
+                # 각도는 정수(도) 단위이므로 최소 변화 1도 기준은 리스트 비교
+                # 한 번(C 수준 원소 비교, None 포함)과 같음. 변화가 없으면
+                # 강제 스냅샷 시점에만 전송
+                if angles is not None and (not first_sent or force or angles != last):
+                    if batch_size > 1:
+                        # 묶음 모드: 샘플을 모아 두었다가 한 메시지로 전송
+                        if not batch:
+                            batch_t0 = now_t
+                        batch.append({"angles": angles, "ts": now_iso(), "seq": seq})
+                        sent = True
+                    else:
+                        # 텔레메트리는 QoS 0 (PUBACK 왕복 없음). retain은 쓰지 않음:
+                        # carebot/tx는 모든 로봇·메시지 종류가 공유하는 토픽이라
+                        # 보관 슬롯이 하나뿐이어서 좌/우 로봇의 자세가 서로 덮어써짐
+                        # 이전 프레임이 아직 전송 대기 중이면 버리고, 다음 틱에 다시 비교
+                        sent = publish(
+                            "joint_state",
+                            b'%s%s,"seq":%d,"ts":"%s"}'
+                            % (
+                                js_prefix,
+                                _json_dumps(angles),
+                                seq,
+                                now_iso().encode("ascii"),
+                            ),
+                            droppable=True,
+                            qos=0,
+                        )
+                    if sent:
+                        seq += 1
+                        last = angles
+                        last_force = now_t
+                        first_sent = True
+                if batch and (
+                    force or len(batch) >= batch_size or (now_t - batch_t0) >= batch_s
+                ):
+                    send(
+                        {
+                            "type": "joint_state_batch",
+                            "ts": now_iso(),
+                            "samples": batch,
+                        },
+                        qos=0,
+                    )
+                    batch = []
+                # 종료 신호가 오면 대기 중이라도 즉시 빠져나감
+                if stop_wait(active_sleep if is_active else idle_sleep):
+                    break
 
         t = threading.Thread(target=_loop, name="JointTelemetry", daemon=True)
         self._telemetry_thread = t
@@ -718,28 +843,19 @@ class CarebotAppMQTT:
             self.mqtt_port,
             self.mqtt_base,
         )
-        # 브로커가 아직 준비되지 않은 경우를 대비해 재시도 루프
-        while True:
-            try:
-                self.client.connect(self.mqtt_host, self.mqtt_port, keepalive=30)
-                break
-            except Exception as e:
-                self.log.warning("mqtt connect failed: %s | retry in 2s", e)
-                time.sleep(2.0)
+        # 브로커가 아직 준비되지 않았어도 loop_forever가 reconnect_delay_set 간격으로 재시도
+        self.client.connect_async(self.mqtt_host, self.mqtt_port, keepalive=30)
         try:
-            self.client.loop_forever()
+            self.client.loop_forever(retry_first_connection=True)
         except KeyboardInterrupt:
-            # 정상 종료 처리
-            try:
-                if self.face_tracking is not None:
-                    self.face_tracking.stop()
-            except Exception:
-                pass
-            try:
-                if getattr(self, "_telemetry_stop", None) is not None:
-                    self._telemetry_stop.set()
-            except Exception:
-                pass
+            # 정상 종료 처리 (얼굴 추적/진행 중 동작 중단)
+            self._cmd_executor.shutdown(wait=False)
+            self._preempt_current()
+            self._action_pool.shutdown(wait=False)
+            if getattr(self, "_telemetry_stop", None) is not None:
+                self._telemetry_stop.set()
+            if self._arm_io is not None:
+                self._arm_io.stop()
 
 
 if __name__ == "__main__":
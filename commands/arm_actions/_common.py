@@ -0,0 +1,49 @@
+import logging
+import time
+
+# 동작 모듈 공용 로거 (app 쪽 basicConfig 설정을 그대로 따름)
+_log = logging.getLogger("carebot.arm_actions")
+
+# 6축 쓰기 실패(드라이버 예외) 시 재시도 전 대기: 첫 시도는 즉시
+_WRITE_RETRY_BACKOFF_S = (0.0, 0.005, 0.01, 0.02)
+
+
+class _ArmActionBase:
+    """Shared primitives for arm actions: cancellable sleep and 6-servo write.
+
+    Subclasses set ``self._write6`` (bound Arm_serial_servo_write6_array) and,
+    to use ``_write6_reliable``, ``self._double_send`` in ``__init__``.
+    """
+
+    def _write6_reliable(self, angles, time_ms: int):
+        """write6_array를 한 번 전송하고, 드라이버 예외가 나면 짧은 백오프
+        (5/10/20ms)로 최대 3회 재시도. arm_double_send 설정 시에는 성공 후
+        30ms 뒤 같은 명령을 한 번 더 전송(드랍이 잦은 보드용 기존 동작)."""
+        for delay in _WRITE_RETRY_BACKOFF_S:
+            if delay:
+                time.sleep(delay)
+            try:
+                self._write6(angles, time_ms)
+                break
+            except Exception:
+                continue
+        else:
+            _log.warning("write6 failed after %d attempts", len(_WRITE_RETRY_BACKOFF_S))
+            return
+        if self._double_send:
+            time.sleep(0.03)
+            try:
+                self._write6(angles, time_ms)
+            except Exception:
+                pass
+
+    def _sleep_interruptible(self, seconds: float, cancel_event) -> bool:
+        """Sleep up to seconds; return False if cancelled during sleep."""
+        if seconds <= 0:
+            # 대기 없음(0/음수 설정): 바로 반환 (time.sleep은 음수에서 예외 발생)
+            return cancel_event is None or not cancel_event.is_set()
+        if cancel_event is None:
+            time.sleep(seconds)
+            return True
+        # 폴링 없이 이벤트에서 대기: 취소되면 즉시 깨어남
+        return not cancel_event.wait(seconds)
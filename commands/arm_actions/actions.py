@@ -1,46 +1,68 @@
 import os
-import time
 from typing import Optional
-import threading
 
+from ._common import _ArmActionBase, _log
 from .action_heart import ActionHeart
 from .action_hug import ActionHug
-from .action_init_pose import ActionInitPose
 
+# Neutral pose used at startup (same as the gestures' return pose)
+_READY_POSE = (90, 150, 20, 20, 90, 30)
+# Conservative all-centred pose for the init_pose command
+_INIT_POSE = (90, 90, 90, 90, 90, 90)
+# Robot id fallback when the caller passes none (read once at import)
+_ENV_ROBOT_ID = os.getenv("CAREBOT_ROBOT_ID")
 
-class ArmActions:
+
+class ArmActions(_ArmActionBase):
     def __init__(
         self,
         arm_device,
-        arm_lock: Optional[threading.Lock] = None,
         robot_id: Optional[str] = None,
         config: Optional[dict] = None,
     ):
         """Wrap high-level arm actions around an already-initialized arm device.
 
         arm_device should be an instance compatible with Arm_Lib.Arm_Device().
+        Pass the ArmIOWorker device proxy when the arm is shared: it already
+        serializes every call, so no extra locking is done here.
+        Gestures must wait via cancel_event.wait() (never a bare time.sleep)
+        so preemption can stop them within a few milliseconds.
         """
         if arm_device is None:
             raise RuntimeError("arm_device is required")
         self.arm = arm_device
-        # Shared lock to serialize all Arm_Lib I/O (reads and writes)
-        self._arm_lock = arm_lock or threading.Lock()
+        # Bind the Arm_Lib entry points once instead of looking them up per call
+        self._write = arm_device.Arm_serial_servo_write
+        self._write6 = arm_device.Arm_serial_servo_write6_array
+        self._read = arm_device.Arm_serial_servo_read
         # 이 인스턴스가 제어하는 로봇 ID (robot_left / robot_right)
-        self.robot_id = robot_id or os.getenv("CAREBOT_ROBOT_ID")
+        self.robot_id = robot_id or _ENV_ROBOT_ID
         # 전체 구성 전달(타이밍, 포트 등)
         self.config = config or {}
+        # 제스처 객체는 한 번만 생성해 재사용 (config 변환도 생성 시 1회)
+        self._heart = ActionHeart(
+            arm_device, robot_id=self.robot_id, config=self.config
+        )
+        self._hug = ActionHug(arm_device, robot_id=self.robot_id, config=self.config)
+
+    def _move_to(
+        self, pose, time_ms: int, cancel_event=None, settle_s: float = 0.0
+    ) -> bool:
+        """Write a 6-servo pose and wait for the move (+settle_s).
 
-    def set_ready_pose(self, time_ms: int = 1500):
-        """Move arm to a neutral/ready pose."""
+        Returns False if cancel_event fired while waiting.
+        """
         try:
-            with self._arm_lock:
-                self.arm.Arm_serial_servo_write6_array(
-                    [90, 150, 20, 20, 90, 30], time_ms
-                )
-            time.sleep(max(0.0, time_ms / 1000.0))
-        except Exception:
+            self._write6(pose, time_ms)
+        except Exception as e:
             # If hardware is not connected, allow caller to continue; command handlers can report errors
-            pass
+            _log.warning("pose write failed: %s", e)
+            return True
+        return self._sleep_interruptible(time_ms / 1000.0 + settle_s, cancel_event)
+
+    def set_ready_pose(self, time_ms: int = 1500, cancel_event=None) -> bool:
+        """Move arm to a neutral/ready pose; False if cancelled on the way."""
+        return self._move_to(_READY_POSE, time_ms, cancel_event)
 
     def shutdown(self):
         """No-op for shared arm device.
@@ -57,28 +79,21 @@ class ArmActions:
         This is adapted from do_actions notebook.
         Returns a short status string.
         """
-        return ActionHeart(
-            self.arm,
-            robot_id=self.robot_id,
-            arm_lock=self._arm_lock,
-            config=self.config,
-        ).run(cancel_event=cancel_event)
+        return self._heart.run(cancel_event=cancel_event)
 
     def hug(self, cancel_event=None) -> str:
         """Perform a gentle 'hug' gesture with the arm and return status."""
-        return ActionHug(
-            self.arm,
-            robot_id=self.robot_id,
-            arm_lock=self._arm_lock,
-            config=self.config,
-        ).run(cancel_event=cancel_event)
+        return self._hug.run(cancel_event=cancel_event)
 
     def init_pose(self, cancel_event=None) -> str:
         """Move the arm to a conservative initial/ready pose.
 
-        Returns 'init_completed' or 'init_cancelled'.
+        Moves to a neutral joint array, waits for the motion plus a short
+        settle, and returns 'init_completed' or 'init_cancelled'.
         """
-        return ActionInitPose(self.arm).run(cancel_event=cancel_event)
+        if self._move_to(_INIT_POSE, 1200, cancel_event, settle_s=0.3):
+            return "init_completed"
+        return "init_cancelled"
 
     # -------- Manual control helpers --------
     def set_joint(self, sid: int, angle: int, time_ms: int = 500) -> str:
@@ -87,8 +102,7 @@ class ArmActions:
             sid = int(sid)
             angle = max(0, min(180, int(angle)))
             t = max(0, int(time_ms))
-            with self._arm_lock:
-                self.arm.Arm_serial_servo_write(sid, angle, t)
+            self._write(sid, angle, t)
             return "ok"
         except Exception as e:
             return f"error:{e}"
@@ -98,10 +112,13 @@ class ArmActions:
         try:
             if not isinstance(angles, (list, tuple)) or len(angles) != 6:
                 return "error:invalid_angles"
-            arr = [max(0, min(180, int(a))) for a in angles]
+            # Clamp to 0..180 with a chained comparison: in-range values (the
+            # common case) skip the max()/min() calls entirely
+            arr = [
+                a if 0 <= a <= 180 else (0 if a < 0 else 180) for a in map(int, angles)
+            ]
             t = max(0, int(time_ms))
-            with self._arm_lock:
-                self.arm.Arm_serial_servo_write6_array(arr, t)
+            self._write6(arr, t)
             return "ok"
         except Exception as e:
             return f"error:{e}"
@@ -111,23 +128,14 @@ class ArmActions:
         try:
             sid = int(sid)
             d = int(delta)
-            # Read current angle; if unavailable, do NOT move.
-            raw = None
-            try:
-                with self._arm_lock:
-                    raw = self.arm.Arm_serial_servo_read(sid)
-            except Exception:
-                return "error:read_failed"
-            if raw is None:
-                return "error:read_failed"
+            # Read current angle; if unavailable (error, None, garbage), do NOT move.
             try:
-                current = int(raw)
+                current = int(self._read(sid))
             except Exception:
                 return "error:read_failed"
             target = max(0, min(180, current + d))
             t = max(0, int(time_ms))
-            with self._arm_lock:
-                self.arm.Arm_serial_servo_write(sid, target, t)
+            self._write(sid, target, t)
             return "ok"
         except Exception as e:
             return f"error:{e}"
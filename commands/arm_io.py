@@ -0,0 +1,106 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+
+def read_angle(device, sid: int) -> Optional[int]:
+    """Read a single servo angle (None if the servo did not answer)."""
+    val = device.Arm_serial_servo_read(sid)
+    return int(val) if val is not None else None
+
+
+def read_all_angles(device, settle_s: float = 0.0) -> list:
+    """Read S1..S6 in one work item; unreadable servos come back as None.
+
+    Uses the driver's bulk query (``Arm_serial_servo_read_all``) when it has
+    one, so a sample is a single bus exchange; otherwise, or if the bulk reply
+    is unusable, falls back to six single-servo reads.
+    """
+    read_bulk = getattr(device, "Arm_serial_servo_read_all", None)
+    if read_bulk is not None:
+        vals = read_bulk()
+        if vals is not None and len(vals) == 6:
+            return [int(v) if v is not None else None for v in vals]
+    res = []
+    for i in range(6):
+        if i and settle_s:
+            time.sleep(settle_s)
+        val = device.Arm_serial_servo_read(i + 1)
+        res.append(int(val) if val is not None else None)
+    return res
+
+
+def _invoke(device, name: str, args: tuple, kwargs: dict) -> Any:
+    return getattr(device, name)(*args, **kwargs)
+
+
+class ArmIOWorker:
+    """Own an Arm_Lib device on a single thread and run every I/O call there.
+
+    Work items are ``fn(device, *args)`` callables executed in FIFO order, so
+    telemetry reads, manual control, gestures and face tracking never touch
+    the bus concurrently and no component has to hold a shared lock.
+    """
+
+    def __init__(self, arm_device, name: str = "ArmIO"):
+        if arm_device is None:
+            raise RuntimeError("arm_device is required")
+        self._device = arm_device
+        # SimpleQueue: C 구현 FIFO (put/get 경로에 파이썬 레벨 락 없음)
+        self._queue: "queue.SimpleQueue[Optional[tuple]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        # Arm_Device 대용: 메서드 호출이 워커 스레드에서 실행됨
+        self.device = _SerializedDevice(self)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue ``fn(device, *args)`` and return a Future for its result."""
+        fut: Future = Future()
+        self._queue.put((fn, args, fut))
+        return fut
+
+    def call(
+        self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None
+    ) -> Any:
+        """Run ``fn(device, *args)`` on the worker and wait for the result."""
+        if threading.current_thread() is self._thread:
+            # 워커 내부에서의 재진입 호출은 바로 실행 (자기 자신을 기다리며 교착 방지)
+            return fn(self._device, *args)
+        return self.submit(fn, *args).result(timeout)
+
+    def stop(self):
+        """Let the worker exit after draining already-queued items."""
+        self._queue.put(None)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            fn, args, fut = item
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(self._device, *args))
+            except BaseException as e:
+                fut.set_exception(e)
+
+
+class _SerializedDevice:
+    """Arm_Device stand-in whose method calls are executed by an ArmIOWorker."""
+
+    def __init__(self, worker: ArmIOWorker):
+        self._worker = worker
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._worker._device, name)
+        if not callable(attr):
+            return attr
+        worker = self._worker
+
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            return worker.call(_invoke, name, args, kwargs)
+
+        return _call
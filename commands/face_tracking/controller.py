@@ -22,19 +22,36 @@ class FaceTrackingController:
 
     def __init__(
         self,
-        arm_device,  # Arm_Lib.Arm_Device()
+        arm_device,  # Arm_Lib.Arm_Device() or the ArmIOWorker device proxy
         camera_index: int = 0,
         update_interval_ms: int = 200,
+        face_min_px: int = 48,
+        face_max_px: int = 240,
+        detect_interval_ms: int = 150,
+        motion_min_px: int = 200,
     ):
         self._arm = arm_device
         self._camera_index = camera_index
         self._update_interval_ms = max(50, update_interval_ms)
+        # 검출할 얼굴 크기 범위(640x480 기준 px): 카스케이드 피라미드 양끝을 잘라
+        # 검사할 윈도우 수를 줄임 (검출은 320x240에서 하므로 절반으로 환산).
+        # Haar 카스케이드의 기본 윈도우가 24x24라 그보다 작게는 찾지 못하므로
+        # 최소값은 24(원본 기준 48px)로 제한
+        self._face_min = max(24, face_min_px // 2)
+        self._face_max = max(self._face_min, face_max_px // 2)
+        # 검출 주기: 서보 명령 제한(150ms)보다 자주 검출해도 반영되지 않으므로
+        # 기본값을 같게 맞춤. 그 사이 프레임은 grab()만 하고 디코딩/검출하지 않음
+        self._detect_interval_s = max(0, detect_interval_ms) / 1000.0
+        # 움직임 게이트: 검출 영상(320x240)에서 밝기 차가 큰 픽셀이 이 개수 미만이면
+        # 장면이 정지한 것으로 보고 검출 생략 (0이면 매번 검출)
+        self._motion_min_px = max(0, motion_min_px)
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
-        # External shared Arm I/O lock can be injected later via setter; default to internal lock if not provided
-        self._arm_lock: Optional[threading.Lock] = None
         self._callback: Optional[Callable[[dict], None]] = None
+        # 캡처 스레드 -> 검출 루프로 넘기는 최신 프레임 1칸 슬롯
+        self._frame_cond = threading.Condition()
+        self._frame_slot: list = [None]
 
         # PID and target states
         self._target_servox = 90
@@ -43,6 +60,11 @@ class FaceTrackingController:
         self._pid_x = PID.PositionalPID(0.25, 0.1, 0.05)
         self._pid_y = PID.PositionalPID(0.25, 0.1, 0.05)
 
+        # OpenCV 내부 병렬화: 캡처 스레드 몫으로 코어 하나를 남기고 나머지를 검출에 사용
+        # (프로세스 전역 설정). SIMD 최적화 경로도 명시적으로 켬
+        cv.setNumThreads(max(1, (os.cpu_count() or 2) - 1))
+        cv.setUseOptimized(True)
+
         # Load cascade from the same folder as this controller first, fallback to cv2 default
         local_dir = os.path.dirname(os.path.abspath(__file__))
         local_cascade = os.path.join(local_dir, "haarcascade_frontalface_default.xml")
@@ -53,13 +75,25 @@ class FaceTrackingController:
                 cv.data.haarcascades + "haarcascade_frontalface_default.xml"
             )
 
+        # YuNet(CNN) 검출기: 모델 파일이 이 폴더에 있고 OpenCV가 지원하면 우선 사용,
+        # 아니면 위 Haar 카스케이드로 검출
+        self._yunet = None
+        yunet_model = os.path.join(local_dir, "face_detection_yunet_2023mar.onnx")
+        if os.path.isfile(yunet_model) and hasattr(cv, "FaceDetectorYN"):
+            try:
+                self._yunet = cv.FaceDetectorYN.create(
+                    yunet_model,
+                    "",
+                    (320, 240),
+                    backend_id=cv.dnn.DNN_BACKEND_OPENCV,
+                    target_id=cv.dnn.DNN_TARGET_CPU,
+                )
+            except Exception:
+                self._yunet = None
+
     def set_callback(self, callback: Callable[[dict], None]):
         self._callback = callback
 
-    def set_arm_io_lock(self, lock: threading.Lock):
-        """Inject a shared Arm I/O lock to serialize Arm_Lib access across components."""
-        self._arm_lock = lock
-
     def start(self) -> bool:
         with self._lock:
             if self._thread and self._thread.is_alive():
@@ -93,8 +127,52 @@ class FaceTrackingController:
             except Exception:
                 pass
 
+    def _emit_state(self, bbox: Optional[Tuple[int, int, int, int]], joints):
+        payload = {
+            "type": "face_tracking",
+            "status": "running",
+            "detected": bbox is not None,
+        }
+        if bbox is not None:
+            x, y, w, h = bbox
+            payload["bbox"] = {"x": x, "y": y, "w": w, "h": h}
+        if joints is not None:
+            payload["joints"] = [int(j) for j in joints]
+        self._emit(payload)
+
+    def _capture_loop(self, cap, detect_interval: float):
+        """Drain the camera and publish the newest decoded frame.
+
+        Every frame is grab()bed (no decode) so the driver never serves stale
+        imagery; only frames at the detection rate are retrieve()d into the
+        one-slot ``_frame_slot``, overwriting one the detector has not taken.
+        """
+        cond = self._frame_cond
+        slot = self._frame_slot
+        clock = time.monotonic
+        stop_is_set = self._stop_event.is_set
+        last_retrieve = 0.0
+        while not stop_is_set():
+            # grab()은 디코딩 없이 다음 프레임만 받아옴 (다음 프레임까지 블록)
+            if not cap.grab():
+                time.sleep(0.02)
+                continue
+            now = clock()
+            if now - last_retrieve < detect_interval:
+                continue
+            ok, frame = cap.retrieve()
+            if not ok:
+                continue
+            last_retrieve = now
+            with cond:
+                slot[0] = frame
+                cond.notify()
+
     def _run(self):
         cap = cv.VideoCapture(self._camera_index)
+        # 드라이버 버퍼를 1프레임으로: 오래된 프레임이 쌓여 지연되는 것 방지
+        cap.set(cv.CAP_PROP_BUFFERSIZE, 1)
+        capture: Optional[threading.Thread] = None
         try:
             if not cap.isOpened():
                 self._emit(
@@ -105,129 +183,214 @@ class FaceTrackingController:
                     }
                 )
                 return
-            last_emit = 0.0
             last_cmd = 0.0
             last_servox: Optional[int] = None
             last_servoy: Optional[int] = None
             min_cmd_interval = 0.15  # seconds, limit how often we command servos
             min_angle_delta = 1  # degrees, ignore tiny adjustments
             interval_s = self._update_interval_ms / 1000.0
+            detect_interval = self._detect_interval_s
+
+            # 캡처는 별도 스레드: 검출(OpenCV C++ 구간은 GIL 해제) 중에도 카메라를 비움
+            cond = self._frame_cond
+            slot = self._frame_slot
+            slot[0] = None
+            capture = threading.Thread(
+                target=self._capture_loop,
+                args=(cap, detect_interval),
+                name="FaceTrackingCapture",
+                daemon=True,
+            )
+            capture.start()
+
+            # 검출용 중간 버퍼: 반환된 배열을 다음 프레임의 dst로 재사용해
+            # 매 프레임 할당을 없앰 (크기가 바뀌면 OpenCV가 다시 할당)
+            gray_buf = None
+            small_buf = None
+            small_gray = None
+            # 움직임 게이트용 기준 프레임(마지막 검출 시점)과 차이 버퍼
+            ref_gray = None
+            diff_buf = None
+            last_faces = ()
+            motion_px = self._motion_min_px
+
+            # 루프 내 상수/속성 조회를 지역 변수로 끌어올림.
+            # 간격 계산은 monotonic: NTP 시각 보정에 흔들리지 않음
+            clock = time.monotonic
+            stop_is_set = self._stop_event.is_set
+            yunet = self._yunet
+            cascade_detect = self._face_cascade.detectMultiScale
+            face_min = (self._face_min, self._face_min)
+            face_max = (self._face_max, self._face_max)
+            write6 = self._arm.Arm_serial_servo_write6_array
+            pid_x = self._pid_x
+            pid_y = self._pid_y
+            # Deadzone around center
+            dead_x0, dead_x1 = 260, 380
+            dead_y0, dead_y1 = 180, 300
+            # PID 출력단 1차 관성 필터 (관성 시간상수, 샘플 시간). SetInertiaTime은
+            # 설정이 아니라 매 스텝 SystemOutput을 갱신하는 필터 단계라 루프에 남김
+            inertia_t, sample_t = 0.01, 0.1
+
+            # 이벤트 발행은 검출과 별도 타이머: 검출 주기가 update_interval_ms의
+            # 약수가 아니어도 발행 주기가 밀리지 않도록 프레임 대기 중에도 깨어나 발행
+            bbox: Optional[Tuple[int, int, int, int]] = None
+            joints = None
+            next_emit = clock()
+            # 마지막 검출 결과를 재사용해 발행하는 최대 시간: 검출 주기의 2배
+            # (카메라 프레임 간격으로 한 번 늦는 것까지 허용). 그보다 오래 새 프레임이
+            # 없으면(카메라 정지 등) 멈춘 bbox 대신 detected: false로 발행
+            stale_s = max(2 * detect_interval, 0.2)
+            last_frame_t = next_emit
 
-            while not self._stop_event.is_set():
-                ok, frame = cap.read()
-                if not ok:
-                    time.sleep(0.02)
+            while not stop_is_set():
+                with cond:
+                    if slot[0] is None:
+                        # 다음 발행 시각 또는 stop() 확인(최대 0.1초)까지 대기
+                        cond.wait(min(0.1, max(0.0, next_emit - clock())))
+                    frame = slot[0]
+                    slot[0] = None
+                if frame is None:
+                    now = clock()
+                    if now >= next_emit:
+                        # 새 프레임이 없으면 최근 검출 결과로, 오래됐으면 미검출로 발행
+                        if now - last_frame_t > stale_s:
+                            bbox = None
+                            joints = None
+                        self._emit_state(bbox, joints)
+                        next_emit = max(next_emit + interval_s, now)
                     continue
-                frame = cv.resize(frame, (640, 480))
-                gray = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
-                faces = self._face_cascade.detectMultiScale(
-                    gray, scaleFactor=1.3, minNeighbors=5
-                )
+                # 320x240에서 검출 (640x480 대비 면적 1/4): 좌표는 2배로 되돌려
+                # 아래 중심(320,240)/데드존 상수가 그대로 유효
+                if yunet is not None:
+                    small_buf = cv.resize(
+                        frame, (320, 240), dst=small_buf, interpolation=cv.INTER_AREA
+                    )
+                    if motion_px:
+                        small_gray = cv.cvtColor(
+                            small_buf, cv.COLOR_BGR2GRAY, dst=small_gray
+                        )
+                else:
+                    gray_buf = cv.cvtColor(frame, cv.COLOR_BGR2GRAY, dst=gray_buf)
+                    small_gray = cv.resize(
+                        gray_buf,
+                        (320, 240),
+                        dst=small_gray,
+                        interpolation=cv.INTER_AREA,
+                    )
+
+                # 움직임 게이트: 마지막 검출 프레임과 비교해 바뀐 픽셀이 적으면
+                # 검출을 건너뛰고 직전 결과를 재사용 (천천히 움직여도 누적되어 감지됨)
+                moving = True
+                if motion_px and ref_gray is not None:
+                    diff_buf = cv.absdiff(small_gray, ref_gray, dst=diff_buf)
+                    _, diff_buf = cv.threshold(
+                        diff_buf, 15, 255, cv.THRESH_BINARY, dst=diff_buf
+                    )
+                    moving = cv.countNonZero(diff_buf) >= motion_px
+                if moving:
+                    if yunet is not None:
+                        _, found = yunet.detect(small_buf)
+                        # Nx15 (x, y, w, h, 랜드마크..., score) 중 bbox만 사용
+                        faces = found[:, :4] if found is not None else ()
+                    else:
+                        faces = cascade_detect(
+                            small_gray,
+                            scaleFactor=1.2,
+                            minNeighbors=3,
+                            minSize=face_min,
+                            maxSize=face_max,
+                            flags=cv.CASCADE_SCALE_IMAGE,
+                        )
+                    last_faces = faces
+                    if motion_px:
+                        # 기준 프레임 교체: 두 버퍼를 맞바꿔 복사/할당 없이 유지
+                        ref_gray, small_gray = small_gray, ref_gray
+                else:
+                    faces = last_faces
 
-                bbox: Optional[Tuple[int, int, int, int]] = None
+                now = clock()
+                last_frame_t = now
+                bbox = None
+                joints = None
                 if len(faces) > 0:
-                    x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
-                    if w >= 10 and h >= 10:
-                        bbox = (int(x), int(y), int(w), int(h))
-                        # Face center
-                        cx = x + w / 2.0
-                        cy = y + h / 2.0
-
-                        # Deadzone around center
-                        dead_x = (260, 380)
-                        dead_y = (180, 300)
-
-                        # Update X (pan)
-                        if not (
-                            (self._target_servox >= 180 and cx <= 320)
-                            or (self._target_servox <= 0 and cx >= 320)
-                        ):
-                            if not (dead_x[0] <= cx <= dead_x[1]):
-                                self._pid_x.SystemOutput = cx
-                                self._pid_x.SetStepSignal(320)
-                                self._pid_x.SetInertiaTime(0.01, 0.1)
-                                target_valuex = int(1500 + self._pid_x.SystemOutput)
-                                self._target_servox = int((target_valuex - 500) / 10)
-                                if self._target_servox > 180:
-                                    self._target_servox = 180
-                                if self._target_servox < 0:
-                                    self._target_servox = 0
-
-                        # Update Y (tilt)
-                        if not (
-                            (self._target_servoy >= 180 and cy <= 240)
-                            or (self._target_servoy <= 0 and cy >= 240)
+                    # 최소 크기(원본 기준 10px = 검출 해상도 5px) 미만은 한 번에 걸러내고
+                    # 남은 후보 중 면적 최대를 NumPy argmax로 선택
+                    faces = faces[(faces[:, 2] >= 5) & (faces[:, 3] >= 5)]
+                if len(faces) > 0:
+                    areas = faces[:, 2] * faces[:, 3]
+                    x, y, w, h = (2 * int(v) for v in faces[int(areas.argmax())])
+                    bbox = (x, y, w, h)
+                    # Face center
+                    cx = x + w / 2.0
+                    cy = y + h / 2.0
+
+                    # Update X (pan)
+                    if not (
+                        (self._target_servox >= 180 and cx <= 320)
+                        or (self._target_servox <= 0 and cx >= 320)
+                    ):
+                        if not (dead_x0 <= cx <= dead_x1):
+                            pid_x.SystemOutput = cx
+                            pid_x.SetStepSignal(320)
+                            pid_x.SetInertiaTime(inertia_t, sample_t)
+                            # 펄스폭(1500 + 출력) -> 각도 ((펄스 - 500) / 10) 를 정수
+                            # 나눗셈 한 번으로: 음수 쪽 반올림 차이는 0 클램프에 흡수됨
+                            self._target_servox = max(
+                                0, min(180, int(1500 + pid_x.SystemOutput) // 10 - 50)
+                            )
+
+                    # Update Y (tilt)
+                    if not (
+                        (self._target_servoy >= 180 and cy <= 240)
+                        or (self._target_servoy <= 0 and cy >= 240)
+                    ):
+                        if not (dead_y0 <= cy <= dead_y1):
+                            pid_y.SystemOutput = cy
+                            pid_y.SetStepSignal(240)
+                            pid_y.SetInertiaTime(inertia_t, sample_t)
+                            self._target_servoy = max(
+                                0, min(360, int(1500 + pid_y.SystemOutput) // 10 - 95)
+                            )
+
+                    joints = [
+                        self._target_servox / 1.0,
+                        135,
+                        self._target_servoy / 2.0,
+                        self._target_servoy / 2.0,
+                        90,
+                        30,
+                    ]
+                    # Rate-limit servo commands and ignore tiny changes to reduce jitter
+                    sx = self._target_servox
+                    # approximate original servoy before halving
+                    sy = self._target_servoy // 2 * 2
+                    should_send = False
+                    if last_servox is None or last_servoy is None:
+                        should_send = True
+                    else:
+                        if (
+                            abs(sx - last_servox) >= min_angle_delta
+                            or abs(sy - last_servoy) >= min_angle_delta
                         ):
-                            if not (dead_y[0] <= cy <= dead_y[1]):
-                                self._pid_y.SystemOutput = cy
-                                self._pid_y.SetStepSignal(240)
-                                self._pid_y.SetInertiaTime(0.01, 0.1)
-                                target_valuey = int(1500 + self._pid_y.SystemOutput)
-                                self._target_servoy = (
-                                    int((target_valuey - 500) / 10) - 45
-                                )
-                                if self._target_servoy > 360:
-                                    self._target_servoy = 360
-                                if self._target_servoy < 0:
-                                    self._target_servoy = 0
-
-                        joints = [
-                            self._target_servox / 1.0,
-                            135,
-                            self._target_servoy / 2.0,
-                            self._target_servoy / 2.0,
-                            90,
-                            30,
-                        ]
-                        # Rate-limit servo commands and ignore tiny changes to reduce jitter
-                        now_cmd = time.time()
-                        sx = int(joints[0])
-                        sy = (
-                            int(joints[2]) * 2
-                        )  # approximate original servoy before halving
-                        should_send = False
-                        if last_servox is None or last_servoy is None:
                             should_send = True
-                        else:
-                            if (
-                                abs(sx - last_servox) >= min_angle_delta
-                                or abs(sy - last_servoy) >= min_angle_delta
-                            ):
-                                should_send = True
-                        if should_send and (now_cmd - last_cmd) >= min_cmd_interval:
-                            try:
-                                if self._arm_lock is not None:
-                                    with self._arm_lock:
-                                        self._arm.Arm_serial_servo_write6_array(
-                                            joints, 500
-                                        )
-                                else:
-                                    self._arm.Arm_serial_servo_write6_array(joints, 500)
-                            except Exception:
-                                pass
-                            last_cmd = now_cmd
-                            last_servox = sx
-                            last_servoy = sy
-                else:
-                    joints = None
+                    if should_send and (now - last_cmd) >= min_cmd_interval:
+                        try:
+                            write6(joints, 500)
+                        except Exception:
+                            pass
+                        last_cmd = now
+                        last_servox = sx
+                        last_servoy = sy
 
-                now = time.time()
-                if (now - last_emit) >= interval_s:
-                    payload = {
-                        "type": "face_tracking",
-                        "status": "running",
-                        "detected": bbox is not None,
-                    }
-                    if bbox is not None:
-                        x, y, w, h = bbox
-                        payload["bbox"] = {"x": x, "y": y, "w": w, "h": h}
-                    if "joints" in locals() and joints is not None:
-                        payload["joints"] = [int(j) for j in joints]
-                    self._emit(payload)
-                    last_emit = now
-
-                time.sleep(0.01)
+                if now >= next_emit:
+                    self._emit_state(bbox, joints)
+                    next_emit = max(next_emit + interval_s, now)
         finally:
+            # grab() 도중에 release하지 않도록 캡처 스레드 종료를 먼저 기다림
+            self._stop_event.set()
+            if capture is not None:
+                capture.join(timeout=1.0)
             try:
                 cap.release()
             except Exception:
@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import threading
 import time
 from typing import Any
 
@@ -10,6 +11,25 @@ except Exception as e:
     print("paho-mqtt is required. pip install paho-mqtt", file=sys.stderr)
     raise
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+
+def _json_dumps(obj: Any) -> bytes:
+    # orjson이 있으면 C 구현으로 바로 bytes 생성 (paho는 bytes를 그대로 전송)
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: Any) -> Any:
+    # bytes를 그대로 받음 (별도 .decode() 불필요)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # WebSocket 백엔드의 라우팅 동작을 그대로 반영한 MQTT 기반 허브입니다.
 #
@@ -36,6 +56,18 @@ class MQTTHub:
         self.topic_carebot_tx = f"{self.base}/carebot/tx"
         self.topic_carebot_rx = f"{self.base}/carebot/rx"
 
+        # 내용이 고정된 응답은 한 번만 직렬화해 두고 bytes 그대로 게시
+        self._err_invalid_json = _json_dumps({"type": "error", "error": "invalid_json"})
+        self._err_missing_command = _json_dumps(
+            {"type": "error", "error": "missing_command"}
+        )
+        self._hello_ack_frontend = _json_dumps(
+            {"type": "hello_ack", "role": "frontend", "who_hop": "backend->client"}
+        )
+        self._hello_ack_carebot = _json_dumps(
+            {"type": "hello_ack", "role": "carebot", "who_hop": "backend->client"}
+        )
+
         # paho-mqtt 2.0 이상에서는 Callback API v2를 권장함
         try:
             self.client = mqtt.Client(
@@ -51,6 +83,12 @@ class MQTTHub:
                 client_id=os.getenv("CAREBOT_MQTT_SERVER_ID", "carebot-backend"),
                 clean_session=True,
             )
+        self._stopped = threading.Event()
+        # 수신 토픽 -> 처리 함수 (메시지마다 dict 조회 한 번으로 분기)
+        self._router = {
+            self.topic_frontend_tx: self._handle_from_frontend,
+            self.topic_carebot_tx: self._handle_from_carebot,
+        }
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
         self.client.on_disconnect = self._on_disconnect
@@ -67,7 +105,15 @@ class MQTTHub:
             except Exception as e:
                 print(f"[mqtt-backend] connect failed: {e} | retry in 2s")
                 time.sleep(2.0)
-        self.client.loop_forever()
+        # 네트워크 루프는 paho 스레드에서 (재연결 포함). publish()는 스레드 안전하고
+        # 송신 버퍼에 넣기만 하므로 수신 콜백에서 바로 호출해도 막히지 않음
+        self.client.loop_start()
+        self._stopped.wait()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.client.disconnect()
+        self.client.loop_stop()
 
     # ---------------- MQTT 콜백 ----------------
     def _on_connect(
@@ -91,107 +137,89 @@ class MQTTHub:
     ):
         print(f"[mqtt-backend] disconnected rc={rc}")
 
-    def _safe_pub(self, topic: str, payload: dict, retain: bool = False):
+    def _safe_pub(self, topic: str, payload: dict | bytes, retain: bool = False):
         try:
-            data = json.dumps(payload)
+            # 미리 직렬화된 bytes는 그대로 전송
+            data = payload if isinstance(payload, bytes) else _json_dumps(payload)
             self.client.publish(topic, data, qos=self.qos, retain=retain)
         except Exception as e:
             print(f"[mqtt-backend] publish error to {topic}: {e}")
 
     def _parse(self, raw: bytes) -> dict | None:
         try:
-            return json.loads(raw.decode("utf-8"))
+            return _json_loads(raw)
         except Exception:
             return None
 
     def _on_message(self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage):
         src = msg.topic
-        try:
-            payload = self._parse(msg.payload)
-        except Exception:
-            payload = None
+        payload = self._parse(msg.payload)
         print(f"[recv] topic={src} payload={msg.payload!r}")
+        handler = self._router.get(src)
+        if handler is not None:
+            handler(payload)
 
+    def _handle_from_frontend(self, payload: dict | None):
         if payload is None:
-            err = {"type": "error", "error": "invalid_json"}
             # 가능한 한 발신 측으로 오류를 반사해서 알림
-            if src == self.topic_frontend_tx:
-                self._safe_pub(self.topic_frontend_rx, err)
-            elif src == self.topic_carebot_tx:
-                self._safe_pub(self.topic_carebot_rx, err)
+            self._safe_pub(self.topic_frontend_rx, self._err_invalid_json)
             return
-
+        msg_type = payload.get("type")
         # Hello 핸드셰이크
-        if payload.get("type") == "hello":
-            if src == self.topic_frontend_tx:
-                self._safe_pub(
-                    self.topic_frontend_rx,
-                    {
-                        "type": "hello_ack",
-                        "role": "frontend",
-                        "who_hop": "backend->client",
-                    },
-                )
-            elif src == self.topic_carebot_tx:
-                self._safe_pub(
-                    self.topic_carebot_rx,
-                    {
-                        "type": "hello_ack",
-                        "role": "carebot",
-                        "who_hop": "backend->client",
-                    },
-                )
+        if msg_type == "hello":
+            self._safe_pub(self.topic_frontend_rx, self._hello_ack_frontend)
             return
 
         # 프런트엔드에서 온 메시지: 명령만 케어봇으로 전달
-        if src == self.topic_frontend_tx:
-            is_command = (payload.get("type") == "command") or (
-                payload.get("type") in (None, "") and "command" in payload
-            )
-            if is_command:
-                cmd = str(payload.get("command") or "").strip()
-                if not cmd:
-                    self._safe_pub(
-                        self.topic_frontend_rx,
-                        {"type": "error", "error": "missing_command"},
-                    )
-                    return
-                out = dict(payload)
-                out.setdefault("type", "command")
-                out["command"] = cmd
-                if "who" not in out:
-                    out["who"] = "frontend"
-                if "who_hop" not in out:
-                    out["who_hop"] = "backend->carebots"
-                self._safe_pub(self.topic_carebot_rx, out)
-                # 프런트엔드로 server_dispatch 통지
-                self._safe_pub(
-                    self.topic_frontend_rx,
-                    {
-                        "type": "server_dispatch",
-                        "command": cmd,
-                        "status": "sent_to_carebots",
-                        "who_hop": "backend->frontend",
-                    },
-                )
+        is_command = (msg_type == "command") or (
+            msg_type in (None, "") and "command" in payload
+        )
+        if not is_command:
             # 명령이 아닌 프런트엔드 메시지는 무시
             return
+        cmd = str(payload.get("command") or "").strip()
+        if not cmd:
+            self._safe_pub(self.topic_frontend_rx, self._err_missing_command)
+            return
+        # _parse가 메시지마다 새 dict를 만들고 _safe_pub이 즉시 직렬화하므로
+        # 복사 없이 그대로 수정해 전달
+        payload.setdefault("type", "command")
+        payload["command"] = cmd
+        payload.setdefault("who", "frontend")
+        payload.setdefault("who_hop", "backend->carebots")
+        self._safe_pub(self.topic_carebot_rx, payload)
+        # 프런트엔드로 server_dispatch 통지
+        self._safe_pub(
+            self.topic_frontend_rx,
+            {
+                "type": "server_dispatch",
+                "command": cmd,
+                "status": "sent_to_carebots",
+                "who_hop": "backend->frontend",
+            },
+        )
 
-        # 케어봇에서 온 메시지: 모두 프런트엔드로 전달
-        if src == self.topic_carebot_tx:
-            out = dict(payload)
-            if "who_hop" not in out:
-                out["who_hop"] = "backend->frontends"
-            retain = bool(out.get("type") == "joint_state")
-            self._safe_pub(self.topic_frontend_rx, out, retain=retain)
+    def _handle_from_carebot(self, payload: dict | None):
+        if payload is None:
+            self._safe_pub(self.topic_carebot_rx, self._err_invalid_json)
+            return
+        # Hello 핸드셰이크
+        if payload.get("type") == "hello":
+            self._safe_pub(self.topic_carebot_rx, self._hello_ack_carebot)
             return
 
+        # 케어봇에서 온 메시지: 모두 프런트엔드로 전달 (복사 없이 수정)
+        payload.setdefault("who_hop", "backend->frontends")
+        retain = payload.get("type") == "joint_state"
+        self._safe_pub(self.topic_frontend_rx, payload, retain=retain)
+
 
 def main():
     hub = MQTTHub()
     try:
         hub.start()
     except KeyboardInterrupt:
+        hub.stop()
         print("[mqtt-backend] stopped")
 
 